@@ -1,12 +1,15 @@
 import math
 import random
-from array import array
 
+import numpy as np
 import pygame
 
 
 WIDTH, HEIGHT = 1100, 650
 FPS = 120
+# Physics runs at a fixed rate independent of rendering; BALL_DAMPING is tuned per step at this rate.
+PHYSICS_DT = 1.0 / 120
+MAX_FRAME_TIME = 0.25
 
 FIELD_MARGIN = 40
 FIELD_CORNER_RADIUS = 92
@@ -32,7 +35,10 @@ BOOST_COOLDOWN = 0.22
 BARRIER_THICKNESS = 6
 BARRIER_SEGMENT_STEP = 8
 BARRIER_LIFETIME = 2.0
+BARRIER_ALPHA_LEVELS = 32
 MAX_INK_LENGTH = GOAL_OPENING * 0.34
+# Broad-phase grid cell; the ball's reach always fits in its cell plus the 8 neighbours.
+BARRIER_GRID_CELL = 2 * (BALL_RADIUS + BARRIER_THICKNESS)
 
 KICKOFF_COUNTDOWN = 3.0
 GOAL_SHIELD_DURATION = 3.0
@@ -82,31 +88,42 @@ def normalize(v):
     return pygame.Vector2(v[0] / length, v[1] / length)
 
 
-def distance_point_to_segment(point, a, b):
-    ap = point - a
-    ab = b - a
-    ab_len_sq = ab.dot(ab)
+def distance_point_to_segment(px, py, ax, ay, bx, by):
+    apx = px - ax
+    apy = py - ay
+    abx = bx - ax
+    aby = by - ay
+    ab_len_sq = abx * abx + aby * aby
     if ab_len_sq == 0:
-        return ap.length(), a, 0.0
-    t = clamp(ap.dot(ab) / ab_len_sq, 0.0, 1.0)
-    closest = a + ab * t
-    return (point - closest).length(), closest, t
-
-
-def segment_normal(a, b):
-    d = b - a
-    n = pygame.Vector2(-d.y, d.x)
-    if n.length_squared() == 0:
-        return pygame.Vector2(0, -1)
-    return n.normalize()
+        return math.hypot(apx, apy), ax, ay, 0.0
+    # clamp() inlined: this is the innermost call of every segment test.
+    t = (apx * abx + apy * aby) / ab_len_sq
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    cx = ax + abx * t
+    cy = ay + aby * t
+    return math.hypot(px - cx, py - cy), cx, cy, t
+
+
+def segment_normal(ax, ay, bx, by):
+    dx = bx - ax
+    dy = by - ay
+    length = math.hypot(dx, dy)
+    if length == 0:
+        return 0.0, -1.0
+    return -dy / length, dx / length
 
 
 def clamp_drag_line(a, b, max_len):
-    delta = b - a
-    dist = delta.length()
+    dx = b.x - a.x
+    dy = b.y - a.y
+    dist = math.hypot(dx, dy)
     if dist <= max_len or dist <= 1e-6:
         return pygame.Vector2(b)
-    return pygame.Vector2(a + delta * (max_len / dist))
+    scale = max_len / dist
+    return pygame.Vector2(a.x + dx * scale, a.y + dy * scale)
 
 
 def draw_panel(surface, rect, radius=14):
@@ -116,42 +133,143 @@ def draw_panel(surface, rect, radius=14):
     surface.blit(panel, rect.topleft)
 
 
-def point_in_rounded_rect(point, rect, radius):
-    if not rect.collidepoint(point.x, point.y):
-        return False
+def rect_bounds(rect):
+    return float(rect.left), float(rect.top), float(rect.right), float(rect.bottom)
 
-    cx = clamp(point.x, rect.left + radius, rect.right - radius)
-    cy = clamp(point.y, rect.top + radius, rect.bottom - radius)
-    dx = point.x - cx
-    dy = point.y - cy
-    return dx * dx + dy * dy <= radius * radius
 
+def point_in_rounded_rect(x, y, bounds, radius):
+    left, top, right, bottom = bounds
+    # Same half-open test as Rect.collidepoint, without the C call on the common miss.
+    if x < left or x >= right or y < top or y >= bottom:
+        return False
 
-class BarrierSegment:
-    def __init__(self, a, b, created):
-        self.a = pygame.Vector2(a)
-        self.b = pygame.Vector2(b)
-        self.created = created
-        self.length = (self.b - self.a).length()
+    cx = clamp(x, left + radius, right - radius)
+    cy = clamp(y, top + radius, bottom - radius)
+    dx = x - cx
+    dy = y - cy
+    return dx * dx + dy * dy <= radius * radius
 
-    def age(self, now):
-        return now - self.created
 
-    def alive(self, now):
-        return self.age(now) < BARRIER_LIFETIME
+class BarrierStore:
+    """Barrier segments kept as parallel arrays in a sliding FIFO buffer.
+
+    Segments are appended in creation order, so the live ones are always the
+    contiguous range [head, tail) and expiry only ever advances head. Indices
+    never wrap: when tail reaches the end, the live range is compacted back to
+    index 0 (growing if needed) and the grid is rebuilt. candidates() relies on
+    indices in [head, tail) being monotonic.
+    """
+
+    FIELDS = ("ax", "ay", "bx", "by", "created", "length")
+
+    def __init__(self, capacity=64):
+        self.ax = np.zeros(capacity, dtype=np.float32)
+        self.ay = np.zeros(capacity, dtype=np.float32)
+        self.bx = np.zeros(capacity, dtype=np.float32)
+        self.by = np.zeros(capacity, dtype=np.float32)
+        self.created = np.zeros(capacity, dtype=np.float64)
+        self.length = np.zeros(capacity, dtype=np.float64)
+        self.head = 0
+        self.tail = 0
+        self.grid = {}
+
+    def __len__(self):
+        return self.tail - self.head
+
+    def clear(self):
+        self.head = 0
+        self.tail = 0
+        self.grid.clear()
+
+    def append(self, ax, ay, bx, by, created, length):
+        if self.tail == len(self.ax):
+            self._make_room()
+        i = self.tail
+        self.ax[i] = ax
+        self.ay[i] = ay
+        self.bx[i] = bx
+        self.by[i] = by
+        self.created[i] = created
+        self.length[i] = length
+        self.tail += 1
+        self._add_to_grid(i, ax, ay, bx, by)
+
+    def drop_front(self, n):
+        # Grid entries below head go stale; candidates() skips them and _make_room() purges them.
+        self.head += n
+        if self.head == self.tail:
+            self.clear()
+
+    def drop_expired(self, now):
+        """Drop expired segments from the front and return the ink length they held."""
+        head = self.head
+        if head == self.tail or now - self.created[head] < BARRIER_LIFETIME:
+            return 0.0
+        # created is non-decreasing, so the expired segments are exactly a prefix of the live range.
+        expired = int(np.searchsorted(self.created[head : self.tail], now - BARRIER_LIFETIME, side="right"))
+        dropped = float(self.length[head : head + expired].sum())
+        self.drop_front(expired)
+        return dropped
+
+    def live(self):
+        h, t = self.head, self.tail
+        return self.ax[h:t], self.ay[h:t], self.bx[h:t], self.by[h:t]
 
     def alpha(self, now):
-        return clamp(1.0 - self.age(now) / BARRIER_LIFETIME, 0.0, 1.0)
+        return np.clip(1.0 - (now - self.created[self.head : self.tail]) / BARRIER_LIFETIME, 0.0, 1.0)
+
+    def candidates(self, x, y):
+        gx = int(x // BARRIER_GRID_CELL)
+        gy = int(y // BARRIER_GRID_CELL)
+        grid = self.grid
+        found = set()
+        for cx in (gx - 1, gx, gx + 1):
+            for cy in (gy - 1, gy, gy + 1):
+                found.update(grid.get((cx, cy), ()))
+        head = self.head
+        return sorted(i for i in found if i >= head)
+
+    def _make_room(self):
+        # Slide the live range back to the start, growing only when it fills over half the buffer.
+        live = len(self)
+        capacity = len(self.ax)
+        if 2 * live > capacity:
+            capacity *= 2
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            new = old if capacity == len(old) else np.zeros(capacity, dtype=old.dtype)
+            new[:live] = old[self.head : self.tail]
+            setattr(self, name, new)
+        self.head = 0
+        self.tail = live
+        self._rebuild_grid()
+
+    def _add_to_grid(self, i, ax, ay, bx, by):
+        # Segments are only a few pixels long, so their bounding cells are a tight cover.
+        x0 = int(min(ax, bx) // BARRIER_GRID_CELL)
+        x1 = int(max(ax, bx) // BARRIER_GRID_CELL)
+        y0 = int(min(ay, by) // BARRIER_GRID_CELL)
+        y1 = int(max(ay, by) // BARRIER_GRID_CELL)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.grid.setdefault((cx, cy), []).append(i)
+
+    def _rebuild_grid(self):
+        self.grid.clear()
+        ax, ay, bx, by = self.live()
+        for i, sax, say, sbx, sby in zip(
+            range(self.head, self.tail), ax.tolist(), ay.tolist(), bx.tolist(), by.tolist()
+        ):
+            self._add_to_grid(i, sax, say, sbx, sby)
 
 
 class BoostPad:
     def __init__(self, a, b):
         self.a = pygame.Vector2(a)
         self.b = clamp_drag_line(self.a, pygame.Vector2(b), BOOST_PAD_MAX_LENGTH)
-        drag_dir = self.b - self.a
-        self.length = drag_dir.length()
+        self.length = math.hypot(self.b.x - self.a.x, self.b.y - self.a.y)
         self.dir = normalize((self.a - self.b))
-        self.valid = self.length >= BOOST_PAD_MIN_DRAG and self.dir.length_squared() > 0
+        self.valid = self.length >= BOOST_PAD_MIN_DRAG and (self.dir.x != 0 or self.dir.y != 0)
 
 
 class Game:
@@ -160,6 +278,8 @@ class Game:
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Ink Soccer Prototype")
         self.clock = pygame.time.Clock()
+        self._bg_surface = self.build_background_surface()
+        self._field_surface = self.build_field_surface()
 
         self.fonts_ok = True
         try:
@@ -169,6 +289,8 @@ class Game:
             self.font_kickoff = pygame.font.SysFont("Avenir Next", 34, bold=True)
         except Exception:
             self.fonts_ok = False
+        if self.fonts_ok:
+            self.build_text_surfaces()
 
         self.sound_ok = False
         self.snd_boost = None
@@ -179,8 +301,11 @@ class Game:
         self.last_countdown_value = None
         self.setup_audio()
 
-        self.ball_pos = pygame.Vector2(WIDTH * 0.5, HEIGHT * 0.5)
-        self.ball_vel = pygame.Vector2()
+        self.bpx = WIDTH * 0.5
+        self.bpy = HEIGHT * 0.5
+        self.bvx = 0.0
+        self.bvy = 0.0
+        self._ball_pos_prev = (self.bpx, self.bpy)
 
         self.left_score = 0
         self.right_score = 0
@@ -188,13 +313,22 @@ class Game:
         self.boost_pad = None
         self.last_boost_time = -10.0
 
-        self.barriers = []
+        self.barriers = BarrierStore()
+        self._barrier_colors = tuple(
+            (
+                int(BARRIER_COLOR[0] * level / BARRIER_ALPHA_LEVELS),
+                int(BARRIER_COLOR[1] * level / BARRIER_ALPHA_LEVELS),
+                int(BARRIER_COLOR[2] * level / BARRIER_ALPHA_LEVELS),
+            )
+            for level in range(BARRIER_ALPHA_LEVELS + 1)
+        )
         self.ink_used = 0.0
 
         self.left_drag_start = None
         self.left_drag_current = None
         self.right_drawing = False
         self.right_last_point = None
+        self._mouse_pos = (0, 0)
 
         self.kickoff_side = random.choice(["left", "right"])
         self.kickoff_phase = "countdown"  # countdown -> waiting_touch -> live
@@ -217,6 +351,10 @@ class Game:
             int(BOOST_BLOCK_DEPTH),
             int(BOOST_BLOCK_HEIGHT),
         )
+        self._left_zone_bounds = rect_bounds(self.left_block_zone)
+        self._right_zone_bounds = rect_bounds(self.right_block_zone)
+        self._zones_overlay = self.build_block_zones_overlay()
+        self._shields_overlay = self.build_shields_overlay()
 
         self.start_kickoff(0.0, self.kickoff_side)
 
@@ -236,13 +374,10 @@ class Game:
             return None
         sample_rate = 44100
         total = int(sample_rate * seconds)
-        buf = array("h")
-        for i in range(total):
-            t = i / sample_rate
-            env = 1.0 - (i / max(1, total - 1))
-            sample = math.sin(2.0 * math.pi * freq_hz * t) * env
-            buf.append(int(32767 * volume * sample))
-        return pygame.mixer.Sound(buffer=buf.tobytes())
+        t = np.arange(total) / sample_rate
+        env = 1.0 - np.arange(total) / max(1, total - 1)
+        samples = (32767 * volume * np.sin(2.0 * np.pi * freq_hz * t) * env).astype(np.int16)
+        return pygame.mixer.Sound(buffer=samples.tobytes())
 
     def play_sound(self, snd):
         if self.sound_ok and snd is not None:
@@ -285,20 +420,26 @@ class Game:
         self.kickoff_countdown_end = now + KICKOFF_COUNTDOWN
         self.shield_end_time = 0.0
         self.last_countdown_value = None
-        self.ball_pos.update(self.half_center_x(conceding_side), HEIGHT * 0.5)
-        self.ball_vel.update(0, 0)
+        self.reset_ball(self.half_center_x(conceding_side), HEIGHT * 0.5)
+
+    def reset_ball(self, x, y):
+        self.bpx = x
+        self.bpy = y
+        self._ball_pos_prev = (x, y)
+        self.bvx = 0.0
+        self.bvy = 0.0
+
+    def clamp_ball_speed(self):
+        speed_sq = self.bvx * self.bvx + self.bvy * self.bvy
+        if speed_sq > BALL_MAX_SPEED * BALL_MAX_SPEED:
+            scale = BALL_MAX_SPEED / math.sqrt(speed_sq)
+            self.bvx *= scale
+            self.bvy *= scale
 
     def remove_expired_barriers(self, now):
-        if not self.barriers:
-            return
-        alive = []
-        used = 0.0
-        for seg in self.barriers:
-            if seg.alive(now):
-                alive.append(seg)
-                used += seg.length
-        self.barriers = alive
-        self.ink_used = used
+        self.ink_used -= self.barriers.drop_expired(now)
+        if not len(self.barriers):
+            self.ink_used = 0.0
 
     def add_barrier_stroke(self, p0, p1, now):
         delta = p1 - p0
@@ -306,45 +447,47 @@ class Game:
         if dist < 1e-5:
             return
 
-        direction = delta / dist
         steps = max(1, int(dist // BARRIER_SEGMENT_STEP))
-
-        prev = pygame.Vector2(p0)
-        for i in range(1, steps + 1):
-            t = i / steps
-            cur = p0 + delta * t
-            piece_len = (cur - prev).length()
+        # Every piece is the same length, so step with plain floats instead of re-measuring each one.
+        step_x = delta.x / steps
+        step_y = delta.y / steps
+        piece_len = dist / steps
+
+        x, y = p0.x, p0.y
+        added = 0
+        for _ in range(steps):
             if self.ink_used + piece_len > MAX_INK_LENGTH:
                 break
-            seg = BarrierSegment(prev, cur, now)
-            self.barriers.append(seg)
-            self.ink_used += seg.length
-            prev = cur
-
-        if prev != p0:
-            self.right_last_point = pygame.Vector2(prev)
+            next_x = x + step_x
+            next_y = y + step_y
+            self.barriers.append(x, y, next_x, next_y, now, piece_len)
+            self.ink_used += piece_len
+            x, y = next_x, next_y
+            added += 1
+
+        if added:
+            self.right_last_point = pygame.Vector2(x, y)
         else:
-            self.right_last_point = pygame.Vector2(p0 + direction * min(dist, 1.0))
+            self.right_last_point = pygame.Vector2(p0 + delta * (min(dist, 1.0) / dist))
 
-    def point_in_boost_block_zone(self, p):
-        return point_in_rounded_rect(p, self.left_block_zone, BOOST_BLOCK_RADIUS) or point_in_rounded_rect(
-            p, self.right_block_zone, BOOST_BLOCK_RADIUS
-        )
+    def point_in_boost_block_zone(self, x, y):
+        # Each zone sits on its own goal line, so only the zone in the point's half can contain it.
+        bounds = self._left_zone_bounds if x < WIDTH * 0.5 else self._right_zone_bounds
+        return point_in_rounded_rect(x, y, bounds, BOOST_BLOCK_RADIUS)
 
     def boost_allowed(self, candidate):
         if candidate is None or not candidate.valid:
             return False
 
-        if self.kickoff_side_restricted() and self.user_side != self.kickoff_side:
+        if not self.kickoff_side_restricted():
+            return True
+        if self.user_side != self.kickoff_side:
             return False
 
-        samples = 11
-        for i in range(samples + 1):
-            t = i / samples
-            p = candidate.a.lerp(candidate.b, t)
-            if self.kickoff_side_restricted() and not self.point_in_side(p, self.kickoff_side):
-                return False
-        return True
+        # Each side is a half-plane, so the pad stays inside it exactly when both endpoints do.
+        return self.point_in_side(candidate.a, self.kickoff_side) and self.point_in_side(
+            candidate.b, self.kickoff_side
+        )
 
     def apply_boost_if_crossed(self, now):
         if self.boost_pad is None or not self.boost_pad.valid:
@@ -352,16 +495,17 @@ class Game:
         if now - self.last_boost_time < BOOST_COOLDOWN:
             return
 
-        d, _, _ = distance_point_to_segment(self.ball_pos, self.boost_pad.a, self.boost_pad.b)
+        pad_a = self.boost_pad.a
+        pad_b = self.boost_pad.b
+        d, _, _, _ = distance_point_to_segment(self.bpx, self.bpy, pad_a.x, pad_a.y, pad_b.x, pad_b.y)
         if d <= BALL_RADIUS + BOOST_PAD_THICKNESS:
             ratio = clamp(self.boost_pad.length / BOOST_PAD_MAX_LENGTH, 0.0, 1.0)
             impulse = BOOST_IMPULSE_MIN + ratio * (BOOST_IMPULSE_MAX - BOOST_IMPULSE_MIN)
-            if self.point_in_boost_block_zone(self.ball_pos):
+            if self.point_in_boost_block_zone(self.bpx, self.bpy):
                 impulse *= BOOST_ZONE_MULTIPLIER
-            self.ball_vel += self.boost_pad.dir * impulse
-            speed = self.ball_vel.length()
-            if speed > BALL_MAX_SPEED:
-                self.ball_vel.scale_to_length(BALL_MAX_SPEED)
+            self.bvx += self.boost_pad.dir.x * impulse
+            self.bvy += self.boost_pad.dir.y * impulse
+            self.clamp_ball_speed()
             self.last_boost_time = now
             self.play_sound(self.snd_boost)
 
@@ -369,28 +513,62 @@ class Game:
                 self.kickoff_phase = "live"
                 self.shield_end_time = now + GOAL_SHIELD_DURATION
 
-    def collide_ball_with_segment(self, seg):
-        d, closest, _ = distance_point_to_segment(self.ball_pos, seg.a, seg.b)
-        if d >= BALL_RADIUS + BARRIER_THICKNESS * 0.5:
+    def collide_barriers_vectorized(self):
+        store = self.barriers
+        if not len(store):
+            return
+        idx = store.candidates(self.bpx, self.bpy)
+        if not idx:
+            return
+
+        idx = np.array(idx)
+        ax = store.ax[idx]
+        ay = store.ay[idx]
+        abx = store.bx[idx] - ax
+        aby = store.by[idx] - ay
+        apx = self.bpx - ax
+        apy = self.bpy - ay
+        t = np.clip((apx * abx + apy * aby) / (abx * abx + aby * aby + 1e-12), 0.0, 1.0)
+        dx = apx - abx * t
+        dy = apy - aby * t
+        reach = BALL_RADIUS + BARRIER_THICKNESS * 0.5
+        hits = idx[dx * dx + dy * dy < reach * reach]
+
+        for i in hits.tolist():
+            self.collide_ball_with_segment(
+                float(store.ax[i]), float(store.ay[i]), float(store.bx[i]), float(store.by[i])
+            )
+
+    def collide_ball_with_segment(self, ax, ay, bx, by):
+        px = self.bpx
+        py = self.bpy
+        reach = BALL_RADIUS + BARRIER_THICKNESS * 0.5
+        d, cx, cy, _ = distance_point_to_segment(px, py, ax, ay, bx, by)
+        if d >= reach:
             return
 
-        n = self.ball_pos - closest
-        if n.length_squared() == 0:
-            n = segment_normal(seg.a, seg.b)
+        if d == 0:
+            nx, ny = segment_normal(ax, ay, bx, by)
         else:
-            n = n.normalize()
+            nx = (px - cx) / d
+            ny = (py - cy) / d
 
-        penetration = BALL_RADIUS + BARRIER_THICKNESS * 0.5 - d
-        self.ball_pos += n * penetration
+        penetration = reach - d
+        self.bpx = px + nx * penetration
+        self.bpy = py + ny * penetration
 
-        vn = self.ball_vel.dot(n)
+        bvx = self.bvx
+        bvy = self.bvy
+        vn = bvx * nx + bvy * ny
         if vn < 0:
-            self.ball_vel -= (1.95 * vn) * n
+            self.bvx = bvx - 1.95 * vn * nx
+            self.bvy = bvy - 1.95 * vn * ny
 
-    def reflect_off_normal(self, normal):
-        vn = self.ball_vel.dot(normal)
+    def reflect_off_normal(self, nx, ny):
+        vn = self.bvx * nx + self.bvy * ny
         if vn > 0:
-            self.ball_vel -= (1.95 * vn) * normal
+            self.bvx -= 1.95 * vn * nx
+            self.bvy -= 1.95 * vn * ny
 
     def shield_active(self, now):
         return now < self.shield_end_time
@@ -399,23 +577,28 @@ class Game:
         if not self.shield_active(now):
             return
 
-        centers = [
-            pygame.Vector2(GOAL_LINE_X_LEFT + SHIELD_INSET_X, HEIGHT * 0.5),
-            pygame.Vector2(GOAL_LINE_X_RIGHT - SHIELD_INSET_X, HEIGHT * 0.5),
-        ]
+        centers = (
+            (GOAL_LINE_X_LEFT + SHIELD_INSET_X, HEIGHT * 0.5),
+            (GOAL_LINE_X_RIGHT - SHIELD_INSET_X, HEIGHT * 0.5),
+        )
         block_radius = SHIELD_RADIUS + BALL_RADIUS
 
-        for center in centers:
-            rel = self.ball_pos - center
-            dist = rel.length()
-            if dist <= 1e-6:
+        for cx, cy in centers:
+            rx = self.bpx - cx
+            ry = self.bpy - cy
+            d2 = rx * rx + ry * ry
+            if d2 <= 1e-12:
                 continue
-            if dist < block_radius:
-                n = rel / dist
-                self.ball_pos = center + n * block_radius
-                vn = self.ball_vel.dot(n)
+            if d2 < block_radius * block_radius:
+                dist = math.sqrt(d2)
+                nx = rx / dist
+                ny = ry / dist
+                self.bpx = cx + nx * block_radius
+                self.bpy = cy + ny * block_radius
+                vn = self.bvx * nx + self.bvy * ny
                 if vn < 0:
-                    self.ball_vel -= (2.25 * vn) * n
+                    self.bvx -= 2.25 * vn * nx
+                    self.bvy -= 2.25 * vn * ny
                     if now - self.last_shield_sound_time > 0.08:
                         self.play_sound(self.snd_shield)
                         self.last_shield_sound_time = now
@@ -425,27 +608,31 @@ class Game:
             self.zone_stall_timer = 0.0
             return
 
-        speed = self.ball_vel.length()
-        in_zone = self.point_in_boost_block_zone(self.ball_pos)
-        if in_zone and speed < STALL_SPEED_THRESHOLD:
+        speed_sq = self.bvx * self.bvx + self.bvy * self.bvy
+        in_zone = self.point_in_boost_block_zone(self.bpx, self.bpy)
+        if in_zone and speed_sq < STALL_SPEED_THRESHOLD * STALL_SPEED_THRESHOLD:
             self.zone_stall_timer += dt
             if self.zone_stall_timer >= STALL_TIME_TO_NUDGE:
-                if self.ball_pos.x <= WIDTH * 0.5:
-                    center = pygame.Vector2(GOAL_LINE_X_LEFT, GOAL_CENTER_Y)
-                    fallback = pygame.Vector2(1, 0)
+                if self.bpx <= WIDTH * 0.5:
+                    cx = GOAL_LINE_X_LEFT
+                    fallback = 1.0
                 else:
-                    center = pygame.Vector2(GOAL_LINE_X_RIGHT, GOAL_CENTER_Y)
-                    fallback = pygame.Vector2(-1, 0)
-
-                n = self.ball_pos - center
-                if n.length_squared() == 0:
-                    n = fallback
+                    cx = GOAL_LINE_X_RIGHT
+                    fallback = -1.0
+
+                nx = self.bpx - cx
+                ny = self.bpy - GOAL_CENTER_Y
+                d2 = nx * nx + ny * ny
+                if d2 == 0:
+                    nx, ny = fallback, 0.0
                 else:
-                    n = n.normalize()
+                    dist = math.sqrt(d2)
+                    nx /= dist
+                    ny /= dist
 
-                self.ball_vel += n * STALL_NUDGE_IMPULSE
-                if self.ball_vel.length() > BALL_MAX_SPEED:
-                    self.ball_vel.scale_to_length(BALL_MAX_SPEED)
+                self.bvx += nx * STALL_NUDGE_IMPULSE
+                self.bvy += ny * STALL_NUDGE_IMPULSE
+                self.clamp_ball_speed()
                 self.zone_stall_timer = 0.0
                 self.play_sound(self.snd_shield)
         else:
@@ -463,75 +650,96 @@ class Game:
         self.clear_drawables()
         self.start_kickoff(now, conceding)
 
-    def handle_rounded_field_collisions_and_goals(self, now):
-        left = FIELD_MARGIN
-        right = WIDTH - FIELD_MARGIN
-        top = FIELD_MARGIN
-        bottom = HEIGHT - FIELD_MARGIN
-        corner = FIELD_CORNER_RADIUS
-
-        in_goal_window = GOAL_TOP <= self.ball_pos.y <= GOAL_BOTTOM
-
-        if self.ball_pos.x - BALL_RADIUS < GOAL_LINE_X_LEFT and in_goal_window:
-            self.on_goal(scorer_right=True, now=now)
-            return True
-
-        if self.ball_pos.x + BALL_RADIUS > GOAL_LINE_X_RIGHT and in_goal_window:
-            self.on_goal(scorer_right=False, now=now)
-            return True
-
-        if left + corner <= self.ball_pos.x <= right - corner and self.ball_pos.y - BALL_RADIUS < top:
-            self.ball_pos.y = top + BALL_RADIUS
-            self.reflect_off_normal(pygame.Vector2(0, -1))
-
-        if left + corner <= self.ball_pos.x <= right - corner and self.ball_pos.y + BALL_RADIUS > bottom:
-            self.ball_pos.y = bottom - BALL_RADIUS
-            self.reflect_off_normal(pygame.Vector2(0, 1))
-
-        if top + corner <= self.ball_pos.y <= GOAL_TOP and self.ball_pos.x - BALL_RADIUS < left:
-            self.ball_pos.x = left + BALL_RADIUS
-            self.reflect_off_normal(pygame.Vector2(-1, 0))
-
-        if GOAL_BOTTOM <= self.ball_pos.y <= bottom - corner and self.ball_pos.x - BALL_RADIUS < left:
-            self.ball_pos.x = left + BALL_RADIUS
-            self.reflect_off_normal(pygame.Vector2(-1, 0))
-
-        if top + corner <= self.ball_pos.y <= GOAL_TOP and self.ball_pos.x + BALL_RADIUS > right:
-            self.ball_pos.x = right - BALL_RADIUS
-            self.reflect_off_normal(pygame.Vector2(1, 0))
-
-        if GOAL_BOTTOM <= self.ball_pos.y <= bottom - corner and self.ball_pos.x + BALL_RADIUS > right:
-            self.ball_pos.x = right - BALL_RADIUS
-            self.reflect_off_normal(pygame.Vector2(1, 0))
-
-        corners = [
-            (pygame.Vector2(left + corner, top + corner), lambda p: p.x < left + corner and p.y < top + corner),
-            (pygame.Vector2(right - corner, top + corner), lambda p: p.x > right - corner and p.y < top + corner),
-            (pygame.Vector2(left + corner, bottom - corner), lambda p: p.x < left + corner and p.y > bottom - corner),
-            (pygame.Vector2(right - corner, bottom - corner), lambda p: p.x > right - corner and p.y > bottom - corner),
-        ]
+    def handle_rounded_field_collisions_and_goals(
+        self,
+        now,
+        *,
+        _left=FIELD_MARGIN,
+        _right=WIDTH - FIELD_MARGIN,
+        _top=FIELD_MARGIN,
+        _bottom=HEIGHT - FIELD_MARGIN,
+        _left_cx=FIELD_MARGIN + FIELD_CORNER_RADIUS,
+        _right_cx=WIDTH - FIELD_MARGIN - FIELD_CORNER_RADIUS,
+        _top_cy=FIELD_MARGIN + FIELD_CORNER_RADIUS,
+        _bottom_cy=HEIGHT - FIELD_MARGIN - FIELD_CORNER_RADIUS,
+        _allowed=FIELD_CORNER_RADIUS - BALL_RADIUS,
+        _gl=GOAL_LINE_X_LEFT,
+        _gr=GOAL_LINE_X_RIGHT,
+        _gt=GOAL_TOP,
+        _gb=GOAL_BOTTOM,
+        _r=BALL_RADIUS,
+    ):
+        # The keyword-only defaults are the single source of field geometry here and load as
+        # fast locals; callers never pass them. _*_cx/_*_cy are the rounded-corner centers.
+        x = self.bpx
+        y = self.bpy
+
+        # Common case: clear of every straight edge and outside the corner quadrants.
+        if _left + _r <= x <= _right - _r and _top + _r <= y <= _bottom - _r:
+            if _left_cx <= x <= _right_cx or _top_cy <= y <= _bottom_cy:
+                return False
 
-        allowed = corner - BALL_RADIUS
-        for center, in_zone in corners:
-            if not in_zone(self.ball_pos):
-                continue
-            rel = self.ball_pos - center
-            dist = rel.length()
-            if dist <= 1e-6:
-                continue
-            if dist > allowed:
-                n = rel / dist
-                self.ball_pos = center + n * allowed
-                self.reflect_off_normal(n)
+        # The goal window lies between the corner arcs and away from the top and bottom lines,
+        # so a ball inside it can only score; none of the wall or corner tests below can fire.
+        if _gt <= y <= _gb:
+            if x - _r < _gl:
+                self.on_goal(scorer_right=True, now=now)
+                return True
+            if x + _r > _gr:
+                self.on_goal(scorer_right=False, now=now)
+                return True
+            return False
 
+        reflect = self.reflect_off_normal
+
+        if _left_cx <= x <= _right_cx and y - _r < _top:
+            y = _top + _r
+            reflect(0.0, -1.0)
+
+        if _left_cx <= x <= _right_cx and y + _r > _bottom:
+            y = _bottom - _r
+            reflect(0.0, 1.0)
+
+        if _top_cy <= y <= _gt and x - _r < _left:
+            x = _left + _r
+            reflect(-1.0, 0.0)
+
+        if _gb <= y <= _bottom_cy and x - _r < _left:
+            x = _left + _r
+            reflect(-1.0, 0.0)
+
+        if _top_cy <= y <= _gt and x + _r > _right:
+            x = _right - _r
+            reflect(1.0, 0.0)
+
+        if _gb <= y <= _bottom_cy and x + _r > _right:
+            x = _right - _r
+            reflect(1.0, 0.0)
+
+        # At most one rounded corner can hold the ball: the quadrant outside the corner centers.
+        if (x < _left_cx or x > _right_cx) and (y < _top_cy or y > _bottom_cy):
+            cx = _left_cx if x < _left_cx else _right_cx
+            cy = _top_cy if y < _top_cy else _bottom_cy
+            rx = x - cx
+            ry = y - cy
+            d2 = rx * rx + ry * ry
+            if d2 > _allowed * _allowed:
+                dist = math.sqrt(d2)
+                nx = rx / dist
+                ny = ry / dist
+                x = cx + nx * _allowed
+                y = cy + ny * _allowed
+                reflect(nx, ny)
+
+        self.bpx = x
+        self.bpy = y
         return False
 
     def update(self, dt, now):
         self.remove_expired_barriers(now)
 
         if self.kickoff_phase == "countdown":
-            self.ball_pos.update(self.half_center_x(self.kickoff_side), HEIGHT * 0.5)
-            self.ball_vel.update(0, 0)
+            self.reset_ball(self.half_center_x(self.kickoff_side), HEIGHT * 0.5)
             remain = max(0.0, self.kickoff_countdown_end - now)
             value = int(math.ceil(remain))
             if value != self.last_countdown_value and value > 0:
@@ -542,18 +750,18 @@ class Game:
             return
 
         if self.kickoff_phase == "waiting_touch":
-            self.ball_pos.update(self.half_center_x(self.kickoff_side), HEIGHT * 0.5)
-            self.ball_vel.update(0, 0)
+            self.reset_ball(self.half_center_x(self.kickoff_side), HEIGHT * 0.5)
             self.apply_boost_if_crossed(now)
             return
 
-        self.ball_pos += self.ball_vel * dt
-        self.ball_vel *= BALL_DAMPING
+        bvx = self.bvx
+        bvy = self.bvy
+        self.bpx += bvx * dt
+        self.bpy += bvy * dt
+        self.bvx = bvx * BALL_DAMPING
+        self.bvy = bvy * BALL_DAMPING
         self.apply_zone_stall_nudge(dt)
-
-        speed = self.ball_vel.length()
-        if speed > BALL_MAX_SPEED:
-            self.ball_vel.scale_to_length(BALL_MAX_SPEED)
+        self.clamp_ball_speed()
 
         self.collide_ball_with_goal_shields(now)
 
@@ -563,11 +771,11 @@ class Game:
 
         self.apply_boost_if_crossed(now)
 
-        for seg in self.barriers:
-            self.collide_ball_with_segment(seg)
+        self.collide_barriers_vectorized()
 
-    def draw_background(self):
-        self.screen.fill(BG_COLOR)
+    def build_background_surface(self):
+        surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+        surface.fill(BG_COLOR)
         for y in range(0, HEIGHT, 2):
             mix = y / HEIGHT
             c = (
@@ -575,34 +783,47 @@ class Game:
                 int(13 + 22 * mix),
                 int(22 + 26 * mix),
             )
-            pygame.draw.line(self.screen, c, (0, y), (WIDTH, y))
+            pygame.draw.line(surface, c, (0, y), (WIDTH, y))
+        return surface
+
+    def build_field_surface(self):
+        # Color-keyed rather than per-pixel alpha so the per-frame blit stays a plain copy.
+        surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+        surface.fill((0, 0, 0))
+        surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
 
-    def draw_field(self):
         pitch = pygame.Rect(FIELD_MARGIN, FIELD_MARGIN, WIDTH - 2 * FIELD_MARGIN, HEIGHT - 2 * FIELD_MARGIN)
-        pygame.draw.rect(self.screen, PITCH_COLOR, pitch, border_radius=FIELD_CORNER_RADIUS)
+        pygame.draw.rect(surface, PITCH_COLOR, pitch, border_radius=FIELD_CORNER_RADIUS)
 
         inner = pitch.inflate(-18, -18)
-        pygame.draw.rect(self.screen, PITCH_INNER_COLOR, inner, width=2, border_radius=max(8, FIELD_CORNER_RADIUS - 10))
-        pygame.draw.rect(self.screen, LINE_COLOR, pitch, width=3, border_radius=FIELD_CORNER_RADIUS)
+        pygame.draw.rect(surface, PITCH_INNER_COLOR, inner, width=2, border_radius=max(8, FIELD_CORNER_RADIUS - 10))
+        pygame.draw.rect(surface, LINE_COLOR, pitch, width=3, border_radius=FIELD_CORNER_RADIUS)
 
         pygame.draw.line(
-            self.screen,
+            surface,
             (150, 225, 215),
             (WIDTH // 2, FIELD_MARGIN + 12),
             (WIDTH // 2, HEIGHT - FIELD_MARGIN - 12),
             2,
         )
-        pygame.draw.circle(self.screen, (150, 225, 215), (WIDTH // 2, HEIGHT // 2), 70, width=2)
+        pygame.draw.circle(surface, (150, 225, 215), (WIDTH // 2, HEIGHT // 2), 70, width=2)
 
         left_goal_box = pygame.Rect(FIELD_MARGIN - GOAL_DEPTH, GOAL_TOP, GOAL_DEPTH, GOAL_OPENING)
         right_goal_box = pygame.Rect(GOAL_LINE_X_RIGHT, GOAL_TOP, GOAL_DEPTH, GOAL_OPENING)
-        pygame.draw.rect(self.screen, GOAL_COLOR, left_goal_box, width=3, border_radius=5)
-        pygame.draw.rect(self.screen, GOAL_COLOR, right_goal_box, width=3, border_radius=5)
+        pygame.draw.rect(surface, GOAL_COLOR, left_goal_box, width=3, border_radius=5)
+        pygame.draw.rect(surface, GOAL_COLOR, right_goal_box, width=3, border_radius=5)
 
-        pygame.draw.line(self.screen, GOAL_COLOR, (GOAL_LINE_X_LEFT, GOAL_TOP), (GOAL_LINE_X_LEFT, GOAL_BOTTOM), 4)
-        pygame.draw.line(self.screen, GOAL_COLOR, (GOAL_LINE_X_RIGHT, GOAL_TOP), (GOAL_LINE_X_RIGHT, GOAL_BOTTOM), 4)
+        pygame.draw.line(surface, GOAL_COLOR, (GOAL_LINE_X_LEFT, GOAL_TOP), (GOAL_LINE_X_LEFT, GOAL_BOTTOM), 4)
+        pygame.draw.line(surface, GOAL_COLOR, (GOAL_LINE_X_RIGHT, GOAL_TOP), (GOAL_LINE_X_RIGHT, GOAL_BOTTOM), 4)
+        return surface
 
-    def draw_boost_block_zones(self):
+    def draw_background(self):
+        self.screen.blit(self._bg_surface, (0, 0))
+
+    def draw_field(self):
+        self.screen.blit(self._field_surface, (0, 0))
+
+    def build_block_zones_overlay(self):
         overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
         pitch_rect = pygame.Rect(FIELD_MARGIN, FIELD_MARGIN, WIDTH - 2 * FIELD_MARGIN, HEIGHT - 2 * FIELD_MARGIN)
         overlay.set_clip(pitch_rect)
@@ -611,17 +832,48 @@ class Game:
         pygame.draw.rect(overlay, BLOCK_ZONE_EDGE, self.left_block_zone, width=3, border_radius=BOOST_BLOCK_RADIUS)
         pygame.draw.rect(overlay, BLOCK_ZONE_EDGE, self.right_block_zone, width=3, border_radius=BOOST_BLOCK_RADIUS)
         overlay.set_clip(None)
-        self.screen.blit(overlay, (0, 0))
+        return overlay
 
-    def draw_shields(self, now):
-        if not self.shield_active(now):
-            return
+    def build_shields_overlay(self):
         overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
         pygame.draw.circle(overlay, SHIELD_COLOR, (int(GOAL_LINE_X_LEFT + SHIELD_INSET_X), HEIGHT // 2), SHIELD_RADIUS)
         pygame.draw.circle(overlay, SHIELD_COLOR, (int(GOAL_LINE_X_RIGHT - SHIELD_INSET_X), HEIGHT // 2), SHIELD_RADIUS)
         pygame.draw.circle(overlay, (255, 190, 115, 210), (int(GOAL_LINE_X_LEFT + SHIELD_INSET_X), HEIGHT // 2), SHIELD_RADIUS, 4)
         pygame.draw.circle(overlay, (255, 190, 115, 210), (int(GOAL_LINE_X_RIGHT - SHIELD_INSET_X), HEIGHT // 2), SHIELD_RADIUS, 4)
-        self.screen.blit(overlay, (0, 0))
+        return overlay
+
+    def build_text_surfaces(self):
+        kickoff_color = (160, 240, 255)
+        self._digit_surfs = {
+            value: self.font_kickoff.render(str(value), True, kickoff_color)
+            for value in range(1, int(math.ceil(KICKOFF_COUNTDOWN)) + 1)
+        }
+        self._go_surf = self.font_kickoff.render("GO", True, kickoff_color)
+        self._hint_surf = self.font_small.render("L-drag: boost  R-drag: wall  R: reset", True, MUTED_TEXT)
+        self._ink_label_surf = self.font_small.render("INK", True, MUTED_TEXT)
+        self._player_label_surfs = {
+            "left": self.font_small.render("Control: Player 1 (Left)", True, TEXT_COLOR),
+            "right": self.font_small.render("Control: Player 2 (Right)", True, TEXT_COLOR),
+        }
+        self._score_surfs = {}
+        self._pct_surfs = {}
+        self._shield_text_surfs = {}
+
+    def cached_text(self, cache, font, text, color):
+        # Dynamic strings rarely change between frames; keep only the latest rendering.
+        surf = cache.get(text)
+        if surf is None:
+            cache.clear()
+            surf = font.render(text, True, color)
+            cache[text] = surf
+        return surf
+
+    def draw_boost_block_zones(self):
+        self.screen.blit(self._zones_overlay, (0, 0))
+
+    def draw_shields(self, now):
+        if self.shield_active(now):
+            self.screen.blit(self._shields_overlay, (0, 0))
 
     def draw_boost_pad(self):
         if self.boost_pad is not None and self.boost_pad.valid:
@@ -630,7 +882,7 @@ class Game:
             pygame.draw.line(self.screen, BOOST_COLOR, a, b, BOOST_PAD_THICKNESS)
 
             pad_vec = self.boost_pad.b - self.boost_pad.a
-            pad_len = pad_vec.length()
+            pad_len = self.boost_pad.length
             if pad_len > 1e-5:
                 tangent = pad_vec / pad_len
                 normal = pygame.Vector2(-tangent.y, tangent.x)
@@ -649,24 +901,40 @@ class Game:
             pygame.draw.line(self.screen, (120, 160, 190), self.left_drag_start, end, 2)
 
     def draw_barriers(self, now):
-        for seg in self.barriers:
-            alpha = seg.alpha(now)
-            color = (
-                int(BARRIER_COLOR[0] * alpha),
-                int(BARRIER_COLOR[1] * alpha),
-                int(BARRIER_COLOR[2] * alpha),
-            )
-            pygame.draw.line(self.screen, color, seg.a, seg.b, BARRIER_THICKNESS)
+        # Consecutive segments of a stroke share endpoints, so each run with the same fade level
+        # goes out as a single polyline instead of one draw call per segment.
+        store = self.barriers
+        live_ax, live_ay, live_bx, live_by = store.live()
+        levels = (store.alpha(now) * BARRIER_ALPHA_LEVELS + 0.5).astype(np.int32)
+        points = []
+        run_level = None
+        for ax, ay, bx, by, level in zip(
+            live_ax.tolist(), live_ay.tolist(), live_bx.tolist(), live_by.tolist(), levels.tolist()
+        ):
+            if level != run_level or (ax, ay) != points[-1]:
+                self.draw_barrier_run(points, run_level)
+                points = [(ax, ay)]
+                run_level = level
+            points.append((bx, by))
+        self.draw_barrier_run(points, run_level)
 
         if self.right_drawing and self.right_last_point is not None:
-            m = pygame.Vector2(pygame.mouse.get_pos())
-            pygame.draw.line(self.screen, (255, 160, 170), self.right_last_point, m, 2)
+            pygame.draw.line(self.screen, (255, 160, 170), self.right_last_point, self._mouse_pos, 2)
 
-    def draw_ball(self):
-        shadow_pos = self.ball_pos + pygame.Vector2(2.4, 2.8)
+    def draw_barrier_run(self, points, level):
+        if len(points) < 2:
+            return
+        pygame.draw.lines(self.screen, self._barrier_colors[level], False, points, BARRIER_THICKNESS)
+
+    def draw_ball(self, alpha=1.0):
+        prev_x, prev_y = self._ball_pos_prev
+        x = prev_x + (self.bpx - prev_x) * alpha
+        y = prev_y + (self.bpy - prev_y) * alpha
+        ball_pos = pygame.Vector2(x, y)
+        shadow_pos = (x + 2.4, y + 2.8)
         pygame.draw.circle(self.screen, (5, 10, 12), shadow_pos, BALL_RADIUS + 1)
-        pygame.draw.circle(self.screen, BALL_COLOR, self.ball_pos, BALL_RADIUS)
-        pygame.draw.circle(self.screen, BALL_STROKE, self.ball_pos, BALL_RADIUS, width=2)
+        pygame.draw.circle(self.screen, BALL_COLOR, ball_pos, BALL_RADIUS)
+        pygame.draw.circle(self.screen, BALL_STROKE, ball_pos, BALL_RADIUS, width=2)
 
     def draw_ui(self, now):
         top_panel = pygame.Rect(WIDTH // 2 - 200, 10, 400, 78)
@@ -676,17 +944,17 @@ class Game:
         draw_panel(self.screen, self.player_toggle_rect, radius=10)
 
         if self.fonts_ok:
-            player_label = "Player 1 (Left)" if self.user_side == "left" else "Player 2 (Right)"
-            ptxt = self.font_small.render(f"Control: {player_label}", True, TEXT_COLOR)
+            ptxt = self._player_label_surfs[self.user_side]
             prect = ptxt.get_rect(center=self.player_toggle_rect.center)
             self.screen.blit(ptxt, prect)
 
-            score_txt = self.font_big.render(f"{self.left_score}  :  {self.right_score}", True, TEXT_COLOR)
+            score_txt = self.cached_text(
+                self._score_surfs, self.font_big, f"{self.left_score}  :  {self.right_score}", TEXT_COLOR
+            )
             score_rect = score_txt.get_rect(center=(top_panel.centerx, top_panel.centery + 2))
             self.screen.blit(score_txt, score_rect)
 
-            label = self.font_small.render("INK", True, MUTED_TEXT)
-            self.screen.blit(label, (ink_panel.x + 16, ink_panel.y + 10))
+            self.screen.blit(self._ink_label_surf, (ink_panel.x + 16, ink_panel.y + 10))
 
         bar_x = ink_panel.x + 16
         bar_y = ink_panel.y + 38
@@ -699,27 +967,27 @@ class Game:
         pygame.draw.rect(self.screen, (160, 210, 230), (bar_x, bar_y, bar_w, bar_h), width=2, border_radius=8)
 
         if self.fonts_ok:
-            pct = self.font_small.render(f"{int(remaining * 100)}%", True, TEXT_COLOR)
+            pct = self.cached_text(self._pct_surfs, self.font_small, f"{int(remaining * 100)}%", TEXT_COLOR)
             self.screen.blit(pct, (bar_x + bar_w - pct.get_width(), bar_y + bar_h + 6))
 
-            hint = self.font_small.render("L-drag: boost  R-drag: wall  R: reset", True, MUTED_TEXT)
-            hint_rect = hint.get_rect(center=(WIDTH // 2, HEIGHT - 20))
-            self.screen.blit(hint, hint_rect)
+            hint_rect = self._hint_surf.get_rect(center=(WIDTH // 2, HEIGHT - 20))
+            self.screen.blit(self._hint_surf, hint_rect)
 
             if self.kickoff_phase == "countdown":
                 remain = max(0.0, self.kickoff_countdown_end - now)
                 value = int(math.ceil(remain))
-                txt = self.font_kickoff.render(str(max(1, value)), True, (160, 240, 255))
+                txt = self._digit_surfs[clamp(value, 1, len(self._digit_surfs))]
                 rect = txt.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 140))
                 self.screen.blit(txt, rect)
             elif self.kickoff_phase == "waiting_touch":
-                txt = self.font_kickoff.render("GO", True, (160, 240, 255))
-                rect = txt.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 140))
-                self.screen.blit(txt, rect)
+                rect = self._go_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 140))
+                self.screen.blit(self._go_surf, rect)
 
             if self.shield_active(now):
                 sec = max(0.0, self.shield_end_time - now)
-                s_txt = self.font_small.render(f"GOAL SHIELDS {sec:0.1f}s", True, (255, 190, 120))
+                s_txt = self.cached_text(
+                    self._shield_text_surfs, self.font_small, f"GOAL SHIELDS {sec:0.1f}s", (255, 190, 120)
+                )
                 s_rect = s_txt.get_rect(center=(WIDTH // 2, 98))
                 self.screen.blit(s_txt, s_rect)
 
@@ -782,15 +1050,24 @@ class Game:
 
     def run(self):
         running = True
+        accumulator = 0.0
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
+            frame_time = self.clock.tick(FPS) / 1000.0
             now = pygame.time.get_ticks() / 1000.0
 
             running = self.handle_events(now)
             if not running:
                 break
+            # Read after the event pump so the wall preview matches the stroke end it just moved.
+            self._mouse_pos = pygame.mouse.get_pos()
 
-            self.update(dt, now)
+            # Clamp long frames so a stall cannot snowball into ever more catch-up steps.
+            accumulator += min(frame_time, MAX_FRAME_TIME)
+            while accumulator >= PHYSICS_DT:
+                self._ball_pos_prev = (self.bpx, self.bpy)
+                self.update(PHYSICS_DT, now)
+                accumulator -= PHYSICS_DT
+            alpha = accumulator / PHYSICS_DT
 
             self.draw_background()
             self.draw_field()
@@ -798,7 +1075,7 @@ class Game:
             self.draw_shields(now)
             self.draw_boost_pad()
             self.draw_barriers(now)
-            self.draw_ball()
+            self.draw_ball(alpha)
             self.draw_ui(now)
             pygame.display.flip()
 